@@ -3,16 +3,26 @@
 Module for configuring and setting up logging.
 """
 
+import functools
 import json
 import logging
 import logging.config
 import os
-from typing import Optional, cast
+import pathlib
+import sys
+from typing import Any, Dict, Optional, Tuple, cast
+
+try:
+    # orjson is optional; it parses configuration files faster than the standard library but is stricter
+    # (no BOM, UTF-16/32, NaN/Infinity or integers beyond 64 bits), see the README
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 
 class CustomLogger(logging.Logger):
     """
-    A custom logger that includes a method to add dividers.
+    A custom logger that includes methods to add dividers, spacers and bordered messages.
     """
 
     def add_divider(
@@ -36,8 +46,34 @@ class CustomLogger(logging.Logger):
         fill: str
             The character used to fill the divider.
         """
-        divider = generate_divider(length, border, fill)
-        self.log(level, divider)
+        # Skip building the divider when the level is filtered out
+        if not self.isEnabledFor(level):
+            return
+
+        self._emit(level, _divider(length, border, fill))
+
+    def add_spacer(
+        self,
+        lines: int = 1,
+        level: int = logging.INFO,
+    ):
+        """
+        Add blank lines to the log at the specified level, emitted as a single log record.
+        The first line carries the formatter's prefix (e.g., timestamp and level) with an empty message.
+
+        Parameters
+        ----------
+        lines: int
+            The number of lines the spacer occupies.
+        level: int
+            The logging level at which the spacer should be logged (e.g., logging.DEBUG, logging.INFO).
+        """
+        # Skip building the spacer when the level is filtered out
+        if not self.isEnabledFor(level):
+            return
+
+        lines = max(lines, 1)  # Ensure at least one line
+        self._emit(level, "\n" * (lines - 1))
 
     def log_with_borders(
         self,
@@ -45,10 +81,12 @@ class CustomLogger(logging.Logger):
         message: str,
         border: str = "|",
         length: int = 50,
+        batch: bool = True,
     ):
         """
         Log a message with borders around it, truncating the message if it exceeds the specified length.
-        Adds a space between the border and the message.
+        Adds a space between the border and the message. Multi-line messages are bordered line by line
+        and, by default, emitted as a single log record.
 
         Parameters
         ----------
@@ -59,8 +97,14 @@ class CustomLogger(logging.Logger):
         border: str
             The character used for the borders.
         length: int
-            The total length of the formatted message, including borders and spaces.
+            The total length of each formatted line, including borders and spaces.
+        batch: bool
+            Whether to emit all lines as one record (one handler dispatch and write) rather than one record per line.
         """
+        # Skip truncating, padding and formatting when the level is filtered out
+        if not self.isEnabledFor(level):
+            return
+
         # Ensure the total length is sufficient for the borders and spaces
         length = max(
             length, 3
@@ -69,14 +113,53 @@ class CustomLogger(logging.Logger):
         # Calculate the maximum length for the message
         max_message_length = length - 2  # Subtract 4 for borders and spaces
 
-        # Truncate or pad the message to fit within max_message_length
-        formatted_message = message[:max_message_length].ljust(max_message_length)
+        # Only split the message when it may span several lines; every separator splitlines()
+        # recognises is non-printable, so printable messages are always a single line
+        message_lines = (
+            (message,) if message.isprintable() else (message.splitlines() or [""])
+        )
+
+        # Truncate or pad each line to fit within max_message_length and add borders and spaces
+        formatted_lines = [
+            f"{border} {line[:max_message_length].ljust(max_message_length)} {border}"
+            for line in message_lines
+        ]
 
-        # Format the message with borders and spaces
-        formatted_message = f"{border} {formatted_message} {border}"
+        # Log all formatted lines as one record
+        if batch:
+            self._emit(level, "\n".join(formatted_lines))
+            return
 
-        # Log the formatted message
-        self.log(level, formatted_message)
+        # Log each formatted line as its own record
+        emit = self._emit
+        for formatted_line in formatted_lines:
+            emit(level, formatted_line)
+
+    def _emit(self, level: int, message: str):
+        """
+        Pass a preformatted message straight to the handlers.
+
+        Callers must already have checked isEnabledFor(level). This skips the repeated level check in Logger.log
+        and the stack walk in findCaller, so the record carries no caller information (pathname, lineno, funcName).
+
+        Parameters
+        ----------
+        level: int
+            The logging level of the record.
+        message: str
+            The fully formatted message to log.
+        """
+        record = self.makeRecord(
+            self.name,
+            level,
+            "(unknown file)",
+            0,
+            message,
+            (),
+            None,
+            "(unknown function)",
+        )
+        self.handle(record)
 
 
 def generate_divider(length: int = 10, border: str = "+", fill: str = "=") -> str:
@@ -97,8 +180,52 @@ def generate_divider(length: int = 10, border: str = "+", fill: str = "=") -> st
     str
         The generated divider line, e.g., '+====+'.
     """
+    return _divider(length, border, fill)
+
+
+@functools.lru_cache(maxsize=256)
+def _divider(length: int, border: str, fill: str) -> str:
+    """
+    Build a divider line, memoized by shape since callers reuse a handful of them.
+    """
     length = max(length, 1)  # Ensure at least one fill character
-    return f"{border}{fill * length}{border}"
+    return sys.intern(f"{border}{fill * length}{border}")
+
+
+# Set the global Logger class to CustomLogger
+logging.setLoggerClass(CustomLogger)
+
+# Create a temporary logger for logging setup issues
+_TEMP_LOGGER = logging.getLogger("setup_logging_temp_logger")
+_TEMP_LOGGER.setLevel(logging.DEBUG)
+
+# Parsed configuration files, keyed by absolute path and stored with their mtime
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _load_config(input_config_file: str) -> Dict[str, Any]:
+    """
+    Load a JSON configuration file, reusing the parsed result while the file is unchanged.
+
+    Parameters
+    ----------
+    input_config_file: str
+        Path to the logging configuration file.
+
+    Returns
+    ----------
+    Dict[str, Any]
+        The parsed configuration, shared with the cache; callers must not modify it.
+    """
+    config_path = os.path.abspath(input_config_file)
+    mtime_ns = os.stat(config_path).st_mtime_ns
+
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, _json_loads(pathlib.Path(config_path).read_bytes()))
+        _CONFIG_CACHE[config_path] = cached
+
+    return cached[1]
 
 
 def setup_logging(
@@ -126,60 +253,60 @@ def setup_logging(
     CustomLogger
         The configured logger.
     """
+    # Set up temporary logging configuration with formatted output (only once)
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.WARNING,
+            format="%(asctime)s - %(levelname)-8s -",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+
+    try:
+        # Load the JSON configuration file into a dictionary (cached while the file is unchanged)
+        config_dict = _load_config(input_config_file)
 
-    # Set the global Logger class to CustomLogger
-    logging.setLoggerClass(CustomLogger)
+        # Dynamically adjust the output log path if provided, rebuilding only the patched path
+        # so the cached configuration stays untouched
+        if output_log_path:
+            try:
+                handlers_config = config_dict["handlers"]
+                handler_config = handlers_config[handler_name]
+            except KeyError:
+                raise KeyError(
+                    f"Handler '{handler_name}' not found in configuration."
+                ) from None
+            config_dict = {
+                **config_dict,
+                "handlers": {
+                    **handlers_config,
+                    handler_name: {**handler_config, "filename": output_log_path},
+                },
+            }
+            _TEMP_LOGGER.debug(
+                "Handler '%s' filename dynamically set to: %s",
+                handler_name,
+                output_log_path,
+            )
 
-    # Set up temporary logging configuration with formatted output
-    logging.basicConfig(
-        level=logging.WARNING,
-        format="%(asctime)s - %(levelname)-8s -",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+        # Ensure the directory for the log file exists (a single stat when it already does)
+        if output_log_path:
+            log_dir = pathlib.Path(output_log_path).parent
+            if not log_dir.is_dir():
+                log_dir.mkdir(parents=True, exist_ok=True)
+                _TEMP_LOGGER.debug("Created directory for log file: %s", log_dir)
 
-    # Create a temporary logger for logging setup issues
-    temp_logger = logging.getLogger("setup_logging_temp_logger")
-    temp_logger.setLevel(logging.DEBUG)
+        # Apply the logging configuration
+        logging.config.dictConfig(config_dict)
 
-    try:
-        # Attempt to open and read the JSON configuration file
-        with open(input_config_file, "r", encoding="utf-8") as file:
-            # Load the JSON file content into a dictionary
-            config_dict = json.load(file)
-
-            # Dynamically adjust the output log path if provided
-            if output_log_path:
-                if handler_name in config_dict.get("handlers", {}):
-                    config_dict["handlers"][handler_name]["filename"] = output_log_path
-                    temp_logger.debug(
-                        "Handler '%s' filename dynamically set to: %s",
-                        handler_name,
-                        output_log_path,
-                    )
-                else:
-                    raise KeyError(
-                        f"Handler '{handler_name}' not found in configuration."
-                    )
-
-            # Ensure the directory for the log file exists
-            if output_log_path:
-                log_dir = os.path.dirname(output_log_path)
-                if log_dir and not os.path.exists(log_dir):
-                    os.makedirs(log_dir, exist_ok=True)
-                    temp_logger.debug("Created directory for log file: %s", log_dir)
-
-            # Apply the logging configuration
-            logging.config.dictConfig(config_dict)
-
-            # Get the logger
-            logger = cast(CustomLogger, logging.getLogger(logger_name))
-
-            return logger
+        # Get the logger
+        logger = cast(CustomLogger, logging.getLogger(logger_name))
+
+        return logger
 
     # Catch errors that might occur during file opening or reading
     except (PermissionError, FileNotFoundError, json.JSONDecodeError) as file_error:
         # Log detailed error message
-        temp_logger.error(
+        _TEMP_LOGGER.error(
             "File operation error: %s. Please check the following:\n"
             "- Does the configuration file exist? Path: %s\n"
             "- Does the file have the correct read permissions?\n"
@@ -192,7 +319,7 @@ def setup_logging(
     # Catch errors that might occur during the configuration process
     except (ValueError, KeyError) as config_error:
         # Log detailed error message
-        temp_logger.error(
+        _TEMP_LOGGER.error(
             "Configuration error: %s. Please check your JSON configuration file for:\n"
             "- Missing required fields (e.g., handlers, loggers).\n"
             "- Incorrect field values.",
@@ -203,7 +330,7 @@ def setup_logging(
     # Catch any other unforeseen exceptions
     except Exception as unexpected_error:
         # Log detailed error message
-        temp_logger.error(
+        _TEMP_LOGGER.error(
             "An unexpected error occurred: %s.\n"
             "Please verify the configuration file, input parameters, and execution environment for potential issues.",
             unexpected_error,
@@ -0,0 +1,10 @@
+"""
+Shared pytest configuration for the logging-toolkit Python tests.
+"""
+
+# Importing necessary modules
+import sys
+from pathlib import Path
+
+# Make the setup_logging module importable, resolving src/python relative to this file
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src/python"))
@@ -1,128 +1,223 @@
-# pylint: disable=wrong-import-position, import-error, line-too-long
+# pylint: disable=import-error, line-too-long
 """
 Tests for the setup_logging function in the logging-toolkit.
 """
 
 # Importing necessary modules and functions
+import json
 import logging
+import logging.config
 import os
-import sys
-from typing import List
+import re
+import shutil
+from pathlib import Path
+from typing import Callable, Iterator, List, Tuple
 
 import pytest
 
-# Define the base directory path and extend sys.path to include necessary directories
-BASE_PATH = "/Users/silver/Logging-Toolkit"
-sys.path.append(os.path.join(BASE_PATH, "src/python"))
-from setup_logging import setup_logging
+# setup_logging is made importable by conftest.py
+from setup_logging import CustomLogger, setup_logging
 
+# Resolve the configuration templates relative to this file
+CONFIG_PATH = Path(__file__).resolve().parents[2] / "src/python"
 
-# Helper function to validate log content
-def validate_log_content(log_path: str, expected_content: List[str]) -> None:
+# The loggers and log paths shared by the tests in this module
+Loggers = Tuple[CustomLogger, CustomLogger, str, str]
+
+# One message per standard logging level
+MESSAGES = (
+    (logging.DEBUG, "This is a DEBUG message."),
+    (logging.INFO, "This is an INFO message."),
+    (logging.WARNING, "This is a WARNING message."),
+    (logging.ERROR, "This is an ERROR message."),
+    (logging.CRITICAL, "This is a CRITICAL message."),
+)
+
+
+# Helper function to read a log file
+def read_log(log_path: str) -> str:
     """
-    Validates that the specified expected content exists in the given log file.
+    Reads the whole content of the given log file, failing the test if it was not generated.
 
     Parameters
     ----------
     log_path : str
         Path to the log file.
-    expected_content : list of str
-        List of strings expected to appear in the log file.
+
+    Returns
+    ----------
+    str
+        The content of the log file.
     """
-    with open(log_path, "r", encoding="utf-8") as log_file:
-        log_content = log_file.read()
-        for expected in expected_content:
-            assert (
-                expected in log_content
-            ), f"Expected '{expected}' not found in log file: {log_path}"
+    try:
+        return Path(log_path).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise AssertionError(f"Log file not found: {log_path}") from None
 
 
-# Define the test function for setup_logging
-def test_setup_logging():
+# Helper function to flush logger handlers
+def flush_handlers(*loggers: logging.Logger) -> None:
     """
-    Tests the setup_logging function for correct logger configuration and file output.
+    Flushes every handler of the given loggers so everything logged is on disk before it is read back.
+
+    Parameters
+    ----------
+    *loggers : logging.Logger
+        The loggers whose handlers should be flushed.
     """
-    # Use test configuration files
-    general_config_path = os.path.join(BASE_PATH, "src/python/general_logging.json")
-    error_config_path = os.path.join(BASE_PATH, "src/python/error_logging.json")
+    for logger in loggers:
+        for handler in logger.handlers:
+            handler.flush()
 
-    # Dynamically adjust the output log paths
-    general_log_path = os.path.join(BASE_PATH, "logs/general.log")
-    error_log_path = os.path.join(BASE_PATH, "logs/error.log")
 
-    # Execute the setup_logging function to configure file_logger and error_logger
-    file_logger = setup_logging(
-        input_config_file=general_config_path,
-        logger_name="general_logger",
-        handler_name="general",
-        output_log_path=general_log_path,
-    )
-    error_logger = setup_logging(
-        input_config_file=error_config_path,
-        logger_name="error_logger",
-        handler_name="error",
-        output_log_path=error_log_path,
-    )
+# Helper function to close logger handlers
+def close_handlers(*loggers: logging.Logger) -> None:
+    """
+    Closes and detaches every handler of the given loggers so no file descriptors or stale handlers are left behind.
 
-    # Test if file_logger is correctly configured
-    assert file_logger is not None
-    file_logger.debug("This is a DEBUG message.")
-    file_logger.info("This is an INFO message.")
-    file_logger.warning("This is a WARNING message.")
-    file_logger.error("This is an ERROR message.")
-    file_logger.critical("This is a CRITICAL message.")
+    Parameters
+    ----------
+    *loggers : logging.Logger
+        The loggers whose handlers should be closed.
+    """
+    for logger in loggers:
+        for handler in logger.handlers:
+            handler.close()
+        logger.handlers.clear()
 
-    # Test if error_logger is correctly configured
-    assert error_logger is not None
-    error_logger.debug("This is a DEBUG message.")
-    error_logger.info("This is an INFO message.")
-    error_logger.warning("This is a WARNING message.")
-    error_logger.error("This is an ERROR message.")
-    error_logger.critical("This is a CRITICAL message.")
-
-    # Verify log files are generated
-    for log_path in [general_log_path, error_log_path]:
-        assert os.path.exists(log_path), f"Log file not found: {log_path}"
-
-    # Verify file_logger log file content
-    validate_log_content(
-        general_log_path,
-        [
-            "This is an INFO message.",
-            "This is a WARNING message.",
-            "This is an ERROR message.",
-            "This is a CRITICAL message.",
-        ],
-    )
 
-    # Verify error_logger log file content
-    validate_log_content(
-        error_log_path,
-        [
-            "This is an ERROR message.",
-            "This is a CRITICAL message.",
-        ],
-    )
+# Helper function to validate log content
+def assert_contains(
+    log_content: str, expected_content: List[str], log_path: str
+) -> None:
+    """
+    Validates that the specified expected content exists in the given log content.
+
+    Parameters
+    ----------
+    log_content : str
+        Content of the log file, as returned by read_log.
+    expected_content : list of str
+        List of strings expected to appear in the log content.
+    log_path : str
+        Path to the log file, used in the failure message.
+    """
+    # Find all expected strings in a single pass over the log content
+    pattern = re.compile("|".join(re.escape(expected) for expected in expected_content))
+    found = set(pattern.findall(log_content))
+
+    # Overlapping matches can hide one another, so confirm any leftovers directly
+    missing = [
+        expected
+        for expected in expected_content
+        if expected not in found and expected not in log_content
+    ]
+    assert not missing, f"Expected {missing} not found in log file: {log_path}"
+
 
-    # Clean up log files (optional)
-    if os.path.exists(general_log_path):
-        os.remove(general_log_path)
-    if os.path.exists(error_log_path):
-        os.remove(error_log_path)
+# Helper function to extract the log lines between two messages
+def lines_between(log_content: str, start_message: str, end_message: str) -> List[str]:
+    """
+    Returns the lines logged between the records of two messages, with the leading timestamp removed.
+
+    Parameters
+    ----------
+    log_content : str
+        Content of the log file, as returned by read_log.
+    start_message : str
+        Message of the record preceding the lines of interest.
+    end_message : str
+        Message of the record following the lines of interest.
+
+    Returns
+    ----------
+    list of str
+        The lines between the two records, without their "%Y-%m-%d %H:%M:%S - " prefix.
+    """
+    log_lines = log_content.splitlines()
+    start = next(i for i, line in enumerate(log_lines) if line.endswith(start_message))
+    end = next(i for i, line in enumerate(log_lines) if line.endswith(end_message))
+    return [
+        re.sub(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} - ", "", line)
+        for line in log_lines[start + 1 : end]
+    ]
+
+
+# Helper function to write a minimal configuration for scratch_logger
+def write_scratch_config(
+    config_path: Path, message_format: str = "%(message)s"
+) -> None:
+    """
+    Writes a JSON configuration with a single "scratch" file handler feeding scratch_logger.
+
+    Parameters
+    ----------
+    config_path : Path
+        Path of the configuration file to write.
+    message_format : str
+        Format string of the handler's formatter.
+    """
+    config = {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {"plain": {"format": message_format}},
+        "handlers": {
+            "scratch": {
+                "class": "logging.FileHandler",
+                "formatter": "plain",
+                "filename": "scratch.log",
+            }
+        },
+        "loggers": {
+            "scratch_logger": {
+                "handlers": ["scratch"],
+                "level": "DEBUG",
+                "propagate": False,
+            }
+        },
+    }
+    config_path.write_text(json.dumps(config), encoding="utf-8")
+
+
+# Helper function to configure scratch_logger
+def setup_scratch_logger(config_path: Path, log_path: str) -> CustomLogger:
+    """
+    Configures scratch_logger from the given scratch configuration, writing to the given log file.
+
+    Parameters
+    ----------
+    config_path : Path
+        Path of the scratch configuration file.
+    log_path : str
+        Path to the output log file.
+
+    Returns
+    ----------
+    CustomLogger
+        The configured scratch_logger.
+    """
+    return setup_logging(str(config_path), "scratch_logger", "scratch", log_path)
 
 
-# Define the test function for setup_logging and CustomLogger
-def test_setup_logging_with_divider():
+# Shared fixture configuring file_logger and error_logger once per test session
+@pytest.fixture(scope="session")
+def loggers(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Loggers]:
     """
-    Tests the setup_logging function for correct logger configuration and verifies the CustomLogger addDivider functionality.
+    Configures file_logger and error_logger with the test configuration files, writing to a temporary directory.
+
+    Yields
+    ----------
+    Loggers
+        The file_logger, the error_logger, and the paths of their log files.
     """
     # Use test configuration files
-    general_config_path = os.path.join(BASE_PATH, "src/python/general_logging.json")
-    error_config_path = os.path.join(BASE_PATH, "src/python/error_logging.json")
+    general_config_path = str(CONFIG_PATH / "general_logging.json")
+    error_config_path = str(CONFIG_PATH / "error_logging.json")
 
-    # Dynamically adjust the output log paths
-    general_log_path = os.path.join(BASE_PATH, "logs/general.log")
-    error_log_path = os.path.join(BASE_PATH, "logs/error.log")
+    # Write the output logs to a temporary directory shared by the session
+    log_dir = tmp_path_factory.mktemp("logs")
+    general_log_path = str(log_dir / "general.log")
+    error_log_path = str(log_dir / "error.log")
 
     # Execute the setup_logging function to configure file_logger and error_logger
     file_logger = setup_logging(
@@ -138,74 +233,92 @@ def test_setup_logging_with_divider():
         output_log_path=error_log_path,
     )
 
-    # Test if file_logger is correctly configured
-    assert file_logger is not None
-    file_logger.add_divider()
-    file_logger.add_divider(length=20, border="*", fill="-")
-    file_logger.add_divider(level=logging.DEBUG, length=15, border="~", fill="=")
+    # Keep records out of the root logger's handlers, whatever the templates say
+    file_logger.propagate = False
+    error_logger.propagate = False
 
-    # Test if error_logger is correctly configured
-    assert error_logger is not None
-    error_logger.add_divider()
-    error_logger.add_divider(level=logging.ERROR, length=10, border="#", fill="~")
+    yield file_logger, error_logger, general_log_path, error_log_path
 
-    # Verify log files are generated
-    for log_path in [general_log_path, error_log_path]:
-        assert os.path.exists(log_path), f"Log file not found: {log_path}"
+    # Close and detach the handlers so no file descriptors or stale handlers outlive the session
+    close_handlers(file_logger, error_logger)
 
-    # Verify file_logger log file content
-    validate_log_content(
-        general_log_path,
-        [
-            "+==========+",
-            "*--------------------*",
-        ],
-    )
 
-    # Verify error_logger log file content
-    validate_log_content(
-        error_log_path,
-        [
-            "#~~~~~~~~~~#",
-        ],
-    )
+# Fixture emptying the shared log files before each test that uses them
+@pytest.fixture
+def empty_logs(loggers: Loggers) -> None:
+    """
+    Truncates the shared log files so each test using the shared loggers only sees the records it logged itself.
+    """
+    for log_path in loggers[2:]:
+        Path(log_path).write_text("", encoding="utf-8")
 
-    # Clean up log files (optional)
-    if os.path.exists(general_log_path):
-        os.remove(general_log_path)
-    if os.path.exists(error_log_path):
-        os.remove(error_log_path)
 
+# Fixture providing a scratch configuration and cleaning up scratch_logger afterwards
+@pytest.fixture
+def scratch_config(tmp_path: Path) -> Iterator[Path]:
+    """
+    Writes the default scratch configuration and yields its path; tests may rewrite it with write_scratch_config.
+    """
+    config_path = tmp_path / "scratch_logging.json"
+    write_scratch_config(config_path)
+
+    yield config_path
+
+    # Close and detach whatever handlers the test left on scratch_logger
+    close_handlers(logging.getLogger("scratch_logger"))
 
-# Define the test function for log_with_borders
-def test_log_with_borders():
+
+# Log messages at every level
+def log_levels(file_logger: CustomLogger, error_logger: CustomLogger) -> None:
     """
-    Tests the log_with_borders method in CustomLogger for correct border formatting and message truncation.
+    Logs one message at each standard level to file_logger and error_logger.
+
+    Parameters
+    ----------
+    file_logger : CustomLogger
+        The logger configured with general_logging.json.
+    error_logger : CustomLogger
+        The logger configured with error_logging.json.
     """
-    # Use test configuration files
-    general_config_path = os.path.join(BASE_PATH, "src/python/general_logging.json")
-    error_config_path = os.path.join(BASE_PATH, "src/python/error_logging.json")
+    for level, message in MESSAGES:
+        file_logger.log(level, message)
 
-    # Dynamically adjust the output log paths
-    general_log_path = os.path.join(BASE_PATH, "logs/general.log")
-    error_log_path = os.path.join(BASE_PATH, "logs/error.log")
+    for level, message in MESSAGES:
+        error_logger.log(level, message)
 
-    # Execute the setup_logging function to configure file_logger and error_logger
-    file_logger = setup_logging(
-        input_config_file=general_config_path,
-        logger_name="general_logger",
-        handler_name="general",
-        output_log_path=general_log_path,
-    )
-    error_logger = setup_logging(
-        input_config_file=error_config_path,
-        logger_name="error_logger",
-        handler_name="error",
-        output_log_path=error_log_path,
-    )
 
-    # Test if file_logger is correctly configured
-    assert file_logger is not None
+# Log dividers through CustomLogger.add_divider
+def add_dividers(file_logger: CustomLogger, error_logger: CustomLogger) -> None:
+    """
+    Adds dividers of several shapes and levels to file_logger and error_logger.
+
+    Parameters
+    ----------
+    file_logger : CustomLogger
+        The logger configured with general_logging.json.
+    error_logger : CustomLogger
+        The logger configured with error_logging.json.
+    """
+    file_logger.add_divider()
+    file_logger.add_divider(length=20, border="*", fill="-")
+    file_logger.add_divider(level=logging.DEBUG, length=15, border="~", fill="=")
+
+    error_logger.add_divider()
+    error_logger.add_divider(level=logging.ERROR, length=10, border="#", fill="~")
+
+
+# Log bordered messages through CustomLogger.log_with_borders
+def log_borders(file_logger: CustomLogger, error_logger: CustomLogger) -> None:
+    """
+    Logs bordered messages, including truncated and multi-line ones, to file_logger and error_logger.
+
+    Parameters
+    ----------
+    file_logger : CustomLogger
+        The logger configured with general_logging.json.
+    error_logger : CustomLogger
+        The logger configured with error_logging.json.
+    """
     file_logger.log_with_borders(logging.ERROR, "Another log", border="*", length=1)
     file_logger.log_with_borders(
         logging.DEBUG, "Short DEBUG message", border="|", length=20
@@ -219,9 +332,16 @@ def test_log_with_borders():
         border="#",
         length=30,
     )
+    file_logger.log_with_borders(
+        logging.INFO, "First line\nSecond line", border="|", length=15
+    )
+    file_logger.log_with_borders(
+        logging.INFO, "Third line\nFourth line", border="|", length=15, batch=False
+    )
+    file_logger.log_with_borders(
+        logging.INFO, "Carriage\rReturn", border="|", length=12
+    )
 
-    # Test if error_logger is correctly configured
-    assert error_logger is not None
     error_logger.log_with_borders(logging.ERROR, "Another log", border="*", length=1)
     error_logger.log_with_borders(
         logging.INFO, "Short INFO message", border="|", length=20
@@ -236,35 +356,245 @@ def test_log_with_borders():
         length=30,
     )
 
-    # Verify log files are generated
-    for log_path in [general_log_path, error_log_path]:
-        assert os.path.exists(log_path), f"Log file not found: {log_path}"
 
-    # Verify file_logger log file content
-    validate_log_content(
-        general_log_path,
+# Log spacers through CustomLogger.add_spacer
+def add_spacers(file_logger: CustomLogger, error_logger: CustomLogger) -> None:
+    """
+    Adds spacers between regular messages to file_logger and error_logger.
+
+    Parameters
+    ----------
+    file_logger : CustomLogger
+        The logger configured with general_logging.json.
+    error_logger : CustomLogger
+        The logger configured with error_logging.json.
+    """
+    file_logger.info("Before spacer")
+    file_logger.add_spacer(3)
+    file_logger.info("After spacer")
+
+    error_logger.error("Before spacer")
+    error_logger.add_spacer(0, level=logging.ERROR)
+    error_logger.error("After spacer")
+
+
+# Logging actions and the content they must leave in the general and error log files
+CASES = [
+    pytest.param(
+        log_levels,
+        [
+            "This is an INFO message.",
+            "This is a WARNING message.",
+            "This is an ERROR message.",
+            "This is a CRITICAL message.",
+        ],
+        [
+            "This is an ERROR message.",
+            "This is a CRITICAL message.",
+        ],
+        id="basic_levels",
+    ),
+    pytest.param(
+        add_dividers,
+        [
+            "+==========+",
+            "*--------------------*",
+        ],
+        [
+            "#~~~~~~~~~~#",
+        ],
+        id="dividers",
+    ),
+    pytest.param(
+        log_borders,
         [
             "* A *",
             "| Short INFO message |",
             "# This message is way too long #",
+            "| First line    |\n| Second line   |",
+            "INFO     - | Fourth line   |",
+            "| Carriage   |\n| Return     |",
         ],
-    )
-
-    # Verify error_logger log file content
-    validate_log_content(
-        error_log_path,
         [
             "* A *",
             "| Short ERROR messag |",
             "# This message is way too long #",
         ],
+        id="borders",
+    ),
+]
+
+
+# Define the test function for setup_logging and the CustomLogger methods
+@pytest.mark.usefixtures("empty_logs")
+@pytest.mark.parametrize("actions, general_expected, error_expected", CASES)
+def test_logging(
+    loggers: Loggers,
+    actions: Callable[[CustomLogger, CustomLogger], None],
+    general_expected: List[str],
+    error_expected: List[str],
+):
+    """
+    Tests the setup_logging function and the CustomLogger methods for correct log file output.
+    """
+    file_logger, error_logger, general_log_path, error_log_path = loggers
+
+    # Test if file_logger and error_logger are correctly configured
+    assert file_logger is not None
+    assert error_logger is not None
+    actions(file_logger, error_logger)
+    flush_handlers(file_logger, error_logger)
+
+    # Verify file_logger log file is generated with the expected content
+    general_content = read_log(general_log_path)
+    assert_contains(general_content, general_expected, general_log_path)
+
+    # Verify error_logger log file is generated with the expected content
+    error_content = read_log(error_log_path)
+    assert_contains(error_content, error_expected, error_log_path)
+
+
+# Define the test function for add_spacer
+@pytest.mark.usefixtures("empty_logs")
+def test_add_spacer(loggers: Loggers):
+    """
+    Tests the add_spacer method in CustomLogger for emitting exactly the requested number of lines.
+    """
+    file_logger, error_logger, general_log_path, error_log_path = loggers
+    add_spacers(file_logger, error_logger)
+    flush_handlers(file_logger, error_logger)
+
+    # Verify the three-line spacer: the prefixed empty record followed by two blank lines
+    general_spacer = lines_between(
+        read_log(general_log_path), "Before spacer", "After spacer"
+    )
+    assert general_spacer == ["INFO     - ", "", ""]
+
+    # Verify a spacer of zero lines still occupies exactly one line
+    error_spacer = lines_between(
+        read_log(error_log_path), "Before spacer", "After spacer"
     )
+    assert error_spacer == ["ERROR    - "]
+
+
+# Define the test function for add_spacer at a disabled level
+def test_add_spacer_disabled_level(scratch_config: Path, tmp_path: Path):
+    """
+    Tests that add_spacer writes nothing when its level is below the logger's level.
+    """
+    log_path = str(tmp_path / "scratch.log")
+    scratch_logger = setup_scratch_logger(scratch_config, log_path)
+
+    # The scratch handler accepts every level, so only the logger's own level can drop the spacer
+    scratch_logger.setLevel(logging.WARNING)
+    scratch_logger.warning("Before spacer")
+    scratch_logger.add_spacer(3)
+    scratch_logger.warning("After spacer")
+    flush_handlers(scratch_logger)
+
+    assert not lines_between(read_log(log_path), "Before spacer", "After spacer")
+
+
+# Define the test function for reloading an edited configuration file
+def test_edited_config_is_reloaded(scratch_config: Path, tmp_path: Path):
+    """
+    Tests that setup_logging picks up a configuration file edited after its first use instead of a cached copy.
+    """
+    log_path = str(tmp_path / "scratch.log")
+
+    # Configure scratch_logger from the original configuration
+    scratch_logger = setup_scratch_logger(scratch_config, log_path)
+    scratch_logger.info("Before edit")
+
+    # Edit the configuration, moving its mtime forward in case the filesystem timestamps are coarse
+    write_scratch_config(scratch_config, "EDITED %(message)s")
+    config_stat = scratch_config.stat()
+    os.utime(
+        scratch_config,
+        ns=(config_stat.st_atime_ns, config_stat.st_mtime_ns + 1_000_000_000),
+    )
+    scratch_logger = setup_scratch_logger(scratch_config, log_path)
+    scratch_logger.info("After edit")
+    flush_handlers(scratch_logger)
+
+    # Verify the second record used the edited formatter
+    log_content = read_log(log_path)
+    assert_contains(log_content, ["Before edit\n", "EDITED After edit\n"], log_path)
+    assert "EDITED Before edit" not in log_content
+
+
+# Define the test function for reconfiguring after another component reset logging
+def test_setup_logging_after_external_dictconfig(scratch_config: Path, tmp_path: Path):
+    """
+    Tests that repeating setup_logging re-enables its logger after another dictConfig call disabled it.
+    """
+    log_path = str(tmp_path / "scratch.log")
+
+    # Remember the enabled loggers, since the external dictConfig disables every existing logger
+    enabled_loggers = [
+        logger
+        for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger) and not logger.disabled
+    ]
+    try:
+        setup_scratch_logger(scratch_config, log_path)
+
+        # Another component reconfigures logging from scratch
+        logging.config.dictConfig({"version": 1})
+
+        # Repeat the same setup and verify the logger works again
+        scratch_logger = setup_scratch_logger(scratch_config, log_path)
+        assert not scratch_logger.disabled
+        scratch_logger.info("Logged after external dictConfig")
+        flush_handlers(scratch_logger)
+
+        assert_contains(
+            read_log(log_path), ["Logged after external dictConfig\n"], log_path
+        )
+    finally:
+        for logger in enabled_loggers:
+            logger.disabled = False
+
+
+# Define the test function for reconfiguring after the handlers were removed
+def test_setup_logging_after_handlers_cleared(scratch_config: Path, tmp_path: Path):
+    """
+    Tests that repeating setup_logging restores the handlers after they were removed from its logger.
+    """
+    log_path = str(tmp_path / "scratch.log")
+    scratch_logger = setup_scratch_logger(scratch_config, log_path)
+
+    # Close and detach the handlers, as a test teardown would
+    close_handlers(scratch_logger)
+
+    # Repeat the same setup and verify the handler is back
+    scratch_logger = setup_scratch_logger(scratch_config, log_path)
+    assert len(scratch_logger.handlers) == 1
+    scratch_logger.info("Logged after handlers cleared")
+    flush_handlers(scratch_logger)
+
+    assert_contains(read_log(log_path), ["Logged after handlers cleared\n"], log_path)
+
+
+# Define the test function for recreating a removed log directory
+def test_setup_logging_recreates_removed_log_dir(scratch_config: Path, tmp_path: Path):
+    """
+    Tests that setup_logging recreates the log directory when it was removed after an earlier setup.
+    """
+    log_dir = tmp_path / "logs"
+    log_path = str(log_dir / "scratch.log")
+    scratch_logger = setup_scratch_logger(scratch_config, log_path)
+
+    # Close the handlers and remove the log directory, as a log cleanup would
+    close_handlers(scratch_logger)
+    shutil.rmtree(log_dir)
+
+    # Repeat the same setup and verify the directory and log file are back
+    scratch_logger = setup_scratch_logger(scratch_config, log_path)
+    scratch_logger.info("Logged after directory removal")
+    flush_handlers(scratch_logger)
 
-    # Clean up log files (optional)
-    if os.path.exists(general_log_path):
-        os.remove(general_log_path)
-    if os.path.exists(error_log_path):
-        os.remove(error_log_path)
+    assert_contains(read_log(log_path), ["Logged after directory removal\n"], log_path)
 
 
 # Run the test if this script is executed as the main program